@@ -4,8 +4,9 @@
 Service that runs Pylint on Python code and returns the result.
 
 This script sets up a server that listens for incoming connections using sockets.
-When a client connects and sends Python code (ending with a specified delimiter), the server
-runs Pylint on the received code and sends back the analysis results to the client.
+When a client connects and sends Python code (preceded by its size, or ending with a
+specified delimiter), the server runs Pylint on the received code and sends back the
+analysis results to the client.
 
 Environment variables:
     IP_ADDRESS: The server's IP address to bind to (default '0.0.0.0')
@@ -14,27 +15,61 @@ Environment variables:
 Functions:
     check_vars_environment():
         Checks and retrieves the IP_ADDRESS and PORT from the environment variables.
+    get_linter():
+        Returns the PyLinter shared by every analysis of the process.
     run_pylint(file_content):
         Runs Pylint on the given Python code and returns the output.
-    handle_client(client_socket, addr):
+    warm_up_pylint():
+        Runs Pylint once so the pool workers are warm before the first request.
+    init_pylint_worker():
+        Initializer of the pool workers.
+    run_pylint_encoded(file_content):
+        Runs Pylint and returns its report encoded as UTF-8.
+    create_pylint_pool():
+        Creates the pool of worker processes that run Pylint.
+    restart_pylint_pool(broken_pool):
+        Replaces the worker pool after one of its workers died.
+    run_pylint_async(file_content):
+        Runs run_pylint_encoded on the worker pool, reusing cached reports.
+    read_source(reader):
+        Reads the source sent by the client, with either framing.
+    handle_client_async(reader, writer):
         Handles a client's connection, receives code, runs Pylint, and sends back the result.
+    serve(env_vars):
+        Runs the asyncio server until SIGINT or SIGTERM is received.
     start_server():
-        Starts the server and begins listening for incoming connections.
+        Starts the asyncio server and begins listening for incoming connections.
 
 Usage:
     - Run this script to start the server.
-    - Connect to the server and send Python code (ending with '<<EOF>>') to be analyzed by Pylint.
+    - Connect to the server and send the size of the Python code as a 4-byte big-endian
+      integer followed by the code, or the code ending with '<<EOF>>', to be analyzed by Pylint.
     - Receive the Pylint analysis results from the server.
 """
 
-import socket
-import subprocess
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
 import os
 import logging
+import multiprocessing
+import signal
+import socket
+import struct
 import tempfile
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import NamedTuple
+from astroid import MANAGER
 from dotenv import load_dotenv
+from pylint.lint import PyLinter, Run
+from pylint.reporters.text import TextReporter
+from pylint.utils import LinterStats
 
 # Load environment variables from config.env
 load_dotenv('config.env')
@@ -48,11 +83,57 @@ parameters = {
     'filename' : 'pylint_service.log'
 }
 logging.basicConfig(**parameters)
-
-# Environment variables Error class
-class EnvironmentVariableError(Exception):
+# The format does not use thread, process or task details, skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+# Header with the size of the source sent by the client (4-byte big-endian)
+SIZE_HEADER = struct.Struct('>I')
+# Delimiter that marks the end of the source sent by clients without a size header
+DELIMITER = b'<<EOF>>'
+# Maximum size of the source sent by a client; bigger sources are rejected
+MAX_SOURCE_BYTES = 1 << 20
+# Seconds a client has to send the whole source
+CLIENT_TIMEOUT = 30
+# Seconds the connected clients have to get their reports once the server stops
+SHUTDOWN_TIMEOUT = 30
+# Kernel receive/send buffer size of the client sockets
+SOCKET_BUFFER_SIZE = 1 << 20
+# Maximum number of Pylint jobs running at the same time: one per CPU this
+# process may run on, which honours affinity masks and cpusets unlike cpu_count()
+MAX_CONCURRENT_JOBS = (len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity')
+                       else os.cpu_count() or 1)
+
+# Bounded pool of worker processes running Pylint outside of the event loop,
+# created by serve()
+PYLINT_POOL: ProcessPoolExecutor | None = None
+PYLINT_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+# Pylint jobs a worker runs before it is replaced by a new one; astroid's
+# inference caches keep growing with every analyzed module
+WORKER_MAX_TASKS = 500
+
+# Tasks of the connected clients, awaited by serve() before stopping
+CLIENT_TASKS: set[asyncio.Task] = set()
+
+# PyLinter shared by every analysis of the process, created by get_linter()
+PYLINTER: PyLinter | None = None
+PYLINTER_LOCK = threading.Lock()
+
+# Directory of the temporary source files, RAM-backed (tmpfs) when available
+TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Number of Pylint reports kept in memory, their total size in bytes (reports
+# can be far bigger than their sources) and how long they stay valid (seconds)
+CACHE_MAX_ENTRIES = 4096
+CACHE_MAX_BYTES = 64 << 20
+CACHE_TTL = 86400
+
+# Pylint Error class
+class PylintError(Exception):
     """
-    Raised when an environment variable is not set or has an invalid value.
+    Raised when Pylint could not analyze a source.
     """
     def __init__(self, message: str) -> None:
         self.message = message
@@ -77,142 +158,488 @@ class StatusEnvironmentVariable(NamedTuple):
     PORT : int
     IP_ADDRESS : str
 
+# class PylintResultCache keeps the reports of already analyzed sources
+class PylintResultCache:
+    """
+    Content-addressed LRU cache of encoded Pylint reports.
+
+    Sources are keyed by their BLAKE2b digest, so a client sending the same
+    code again gets the previous report without running Pylint.
+
+    Attributes:
+    -----------
+    max_entries : int
+        Maximum number of reports kept; the least recently used is evicted.
+    ttl : float
+        Number of seconds a report stays valid.
+    max_bytes : int
+        Maximum total size of the reports kept; the least recently used are
+        evicted, and a bigger report is not cached at all.
+    """
+    def __init__(self, max_entries: int, ttl: float, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._total_bytes = 0
+
+    @staticmethod
+    def key(file_content: str) -> str:
+        """
+        Returns the cache key of the given source.
+        """
+        return hashlib.blake2b(file_content.encode('utf-8', 'surrogateescape'),
+                               digest_size=16).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the cached report for key, or None if missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, output = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._total_bytes -= len(output)
+            return None
+        self._entries.move_to_end(key)
+        return output
+
+    def set(self, key: str, output: bytes) -> None:
+        """
+        Stores the report for key, evicting the least recently used entries.
+        """
+        if len(output) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._total_bytes -= len(previous[1])
+        self._entries[key] = (time.monotonic() + self.ttl, output)
+        self._total_bytes += len(output)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+PYLINT_CACHE = PylintResultCache(CACHE_MAX_ENTRIES, CACHE_TTL, CACHE_MAX_BYTES)
+
 # check_vars_environment
 def check_vars_environment() -> StatusEnvironmentVariable:
     """
     Checks and validates the IP_ADDRESS and PORT environment variables.
 
     If the variables are missing or invalid, default values are used.
+    The service reads them once at import time, see ENV.
 
     Returns:
         StatusEnvironmentVariable: An object containing the status, PORT,
             and IP_ADDRESS.
     """
-    try:
-        ip_address = os.getenv('IP_ADDRESS')
-        port = os.getenv('PORT')
-        if ip_address is None or not ip_address.split():
-            raise EnvironmentVariableError(f"Missing or invalid IP_ADDRESS {ip_address}")
-        if port is None or not port.isdigit() or int(port) <= 0:
-            raise EnvironmentVariableError(f'Missing or invalid PORT {port}')
-        return StatusEnvironmentVariable(status=True, PORT=int(port), IP_ADDRESS=ip_address)
-
-    except (EnvironmentVariableError, ValueError) as error:
-        logging.warning('Error at check_vars_environment %s', error, exc_info=True)
+    ip_address = os.environ.get('IP_ADDRESS')
+    port = os.environ.get('PORT')
+    # isdecimal rejects signs and the digits int() cannot parse, so only 0 is left
+    if (not ip_address or ip_address.isspace()
+            or not port or not port.isdecimal() or int(port) == 0):
+        logging.warning('Missing or invalid IP_ADDRESS %s or PORT %s, using defaults',
+                        ip_address, port)
         return StatusEnvironmentVariable(status=False, PORT=5000, IP_ADDRESS='0.0.0.0')
+    return StatusEnvironmentVariable(status=True, PORT=int(port), IP_ADDRESS=ip_address)
+
+# Server address, validated once when the module is loaded
+ENV = check_vars_environment()
+
+# get_linter
+def get_linter() -> PyLinter:
+    """
+    Returns the PyLinter shared by every analysis of this process.
+
+    It is built on the first call the same way the pylint command builds
+    it: configuration files are read and the default checkers are loaded.
+    Persistent statistics are disabled, since every request lints a new
+    temporary module.
+
+    Returns:
+        PyLinter: The configured linter.
+    """
+    global PYLINTER  # pylint: disable=global-statement
+    if PYLINTER is None:
+        # Run needs a file to lint; its report is discarded
+        run = Run(['--persistent=n', os.devnull], reporter=TextReporter(io.StringIO()),
+                  exit=False)
+        PYLINTER = run.linter
+    return PYLINTER
 
 # run_pylint
 def run_pylint(file_content: str) -> str:
     """
     Runs Pylint on a temporary file with the provided content.
 
+    Pylint runs inside the current process with the linter returned by
+    get_linter(), so the pool workers load pylint's configuration and
+    checkers once and reuse them for every request.
+
     Args:
         file_content (str): Content of the file to be analyzed.
 
     Returns:
-        str: Pylint's standard output as plain text.
+        str: Pylint's report as plain text.
+
+    Raises:
+        PylintError: Pylint failed or exited before producing a report.
     """
     temp_file_path = ''
     try:
-        # Create a temporary file securely
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
-            temp_file.write(file_content.encode('utf-8'))
+        # Create a temporary file securely, in memory when /dev/shm is available
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py", dir=TEMP_DIR) as temp_file:
+            # Bytes that were not valid UTF-8 are written back unchanged
+            temp_file.write(file_content.encode('utf-8', 'surrogateescape'))
             temp_file_path = temp_file.name
 
-        # Run pylint on the temporary file and capture the standard output
-        result = subprocess.run(
-            ["pylint", temp_file_path],
-            capture_output=True, text=True
-        )
-
-        # Check if pylint encountered any errors
-        if result.returncode != 0:
-            logging.error("Error running pylint: %s", result.stderr)
-            return result.stderr
+        # Run pylint on the temporary file and capture the report; the
+        # linter keeps per-run state, so only one analysis uses it at a time
+        output = io.StringIO()
+        with PYLINTER_LOCK:
+            linter = get_linter()
+            linter.set_reporter(TextReporter(output))
+            linter.stats = LinterStats()
+            try:
+                linter.check([temp_file_path])
+                linter.generate_reports()
+            finally:
+                # Every request is a new module, drop it from astroid's module
+                # cache; the inference caches still grow, see WORKER_MAX_TASKS
+                module_name = os.path.splitext(os.path.basename(temp_file_path))[0]
+                MANAGER.astroid_cache.pop(module_name, None)
 
         # Return Pylint's output (plain text)
-        return result.stdout
-    except subprocess.CalledProcessError as error:
+        return output.getvalue()
+    # Pylint exits on invalid configuration, which would kill the pool worker
+    except (Exception, SystemExit) as error:  # pylint: disable=broad-exception-caught
         logging.error("Error running Pylint: %s", error, exc_info=True)
-        return f"Error running Pylint: {error}"
+        raise PylintError(f"Error running Pylint: {error}") from error
     finally:
         # Delete the temporary file if it was created
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
+        if temp_file_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_file_path)
+
+# warm_up_pylint
+def warm_up_pylint() -> None:
+    """
+    Runs Pylint once on a trivial source and discards the report.
+
+    Used as the initializer of the pool workers, so astroid's caches of the
+    builtin modules are filled before the first client request.
+    """
+    with contextlib.suppress(PylintError):
+        # Already logged; the requests will report the error to the clients
+        run_pylint("pass\n")
+
+# init_pylint_worker
+def init_pylint_worker() -> None:
+    """
+    Initializer of the pool workers.
+
+    Workers ignore SIGINT: a Ctrl+C reaches the whole process group, and
+    the server process shuts its pool down by itself. Then Pylint is warmed
+    up with warm_up_pylint().
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    warm_up_pylint()
+
+# run_pylint_encoded
+def run_pylint_encoded(file_content: str) -> bytes:
+    """
+    Runs Pylint and returns its report already encoded for the wire.
+
+    Used by the worker pool, so the encoding happens in the worker and the
+    event loop can hand the bytes straight to the transport.
+
+    Args:
+        file_content (str): Content of the file to be analyzed.
+
+    Returns:
+        bytes: Pylint's report encoded as UTF-8.
+    """
+    return run_pylint(file_content).encode('utf-8', 'surrogateescape')
+
+# create_pylint_pool
+def create_pylint_pool() -> ProcessPoolExecutor:
+    """
+    Creates the pool of worker processes that run Pylint.
+
+    Workers are started on demand while clients are connected; a forkserver
+    keeps them from inheriting (and holding open) the client sockets. Each
+    worker is replaced after WORKER_MAX_TASKS jobs, which bounds its memory.
+
+    Returns:
+        ProcessPoolExecutor: The new worker pool.
+    """
+    return ProcessPoolExecutor(
+        max_workers=MAX_CONCURRENT_JOBS,
+        mp_context=multiprocessing.get_context('forkserver'),
+        initializer=init_pylint_worker,
+        max_tasks_per_child=WORKER_MAX_TASKS
+    )
+
+# restart_pylint_pool
+def restart_pylint_pool(broken_pool: ProcessPoolExecutor | None) -> None:
+    """
+    Replaces the worker pool after one of its workers died.
+
+    A pool whose worker was killed (for example by the OOM killer) fails
+    every job submitted afterwards, so it is replaced by a new one. Only
+    the first of the jobs that failed with the same pool replaces it.
+
+    Args:
+        broken_pool (ProcessPoolExecutor | None): The pool the job failed on.
+    """
+    global PYLINT_POOL  # pylint: disable=global-statement
+    if PYLINT_POOL is broken_pool:
+        logging.error('A Pylint worker died, restarting the worker pool')
+        if broken_pool is not None:
+            broken_pool.shutdown(wait=False)
+        PYLINT_POOL = create_pylint_pool()
+
+# run_pylint_async
+async def run_pylint_async(file_content: str) -> bytes:
+    """
+    Runs Pylint on the worker pool without blocking the event loop.
+
+    Reports are looked up in PYLINT_CACHE first, and the number of
+    concurrent jobs is capped by PYLINT_SEMAPHORE. Only reports are
+    cached, never failures. If a worker died, the pool is restarted for
+    the next requests.
+
+    Args:
+        file_content (str): Content of the file to be analyzed.
+
+    Returns:
+        bytes: Pylint's report encoded as UTF-8.
+
+    Raises:
+        PylintError: Pylint could not analyze the source.
+        BrokenProcessPool: A pool worker died while running Pylint.
+    """
+    key = PYLINT_CACHE.key(file_content)
+    cached_output = PYLINT_CACHE.get(key)
+    if cached_output is not None:
+        return cached_output
+
+    loop = asyncio.get_running_loop()
+    async with PYLINT_SEMAPHORE:
+        pool = PYLINT_POOL
+        try:
+            pylint_output = await loop.run_in_executor(pool, run_pylint_encoded, file_content)
+        except BrokenProcessPool:
+            restart_pylint_pool(pool)
+            raise
+    PYLINT_CACHE.set(key, pylint_output)
+    return pylint_output
+
+# read_source
+async def read_source(reader: asyncio.StreamReader) -> memoryview:
+    """
+    Reads the source sent by the client.
 
-# handle_client
-def handle_client(client_socket, addr) -> None:
+    Clients send the size of the source in a SIZE_HEADER followed by the
+    source, which is then read in a single call without scanning it. Older
+    clients send the source ending with DELIMITER instead. A size up to
+    MAX_SOURCE_BYTES always starts with a zero byte, which never appears
+    in Python code, so the first byte tells both framings apart.
+
+    Args:
+        reader (asyncio.StreamReader): Stream to read the client's data from.
+
+    Returns:
+        memoryview: The source, without header or delimiter.
+
+    Raises:
+        asyncio.LimitOverrunError: The source is bigger than MAX_SOURCE_BYTES.
+        asyncio.IncompleteReadError: The client closed the connection before
+            sending the announced size.
+    """
+    try:
+        first = await reader.readexactly(1)
+    except asyncio.IncompleteReadError:
+        # The client closed the connection without sending anything
+        return memoryview(b'')
+
+    if first == b'\x00':
+        header = first + await reader.readexactly(SIZE_HEADER.size - 1)
+        (size,) = SIZE_HEADER.unpack(header)
+        if size > MAX_SOURCE_BYTES:
+            raise asyncio.LimitOverrunError('Source exceeds MAX_SOURCE_BYTES', 0)
+        return memoryview(await reader.readexactly(size))
+
+    # Every delimiter ends with '<EOF>>', even one that starts with the byte
+    # already read, and the '<' before it tells whether it is the delimiter
+    data = first
+    try:
+        data += await reader.readuntil(DELIMITER[1:])
+        if not data.endswith(DELIMITER):
+            # That '<EOF>>' belongs to the source and no delimiter can start
+            # inside it, so the next one is found by a plain search
+            data += await reader.readuntil(DELIMITER)
+        # Strip the delimiter through a memoryview instead of copying the source
+        source = memoryview(data)[:-len(DELIMITER)]
+    except asyncio.IncompleteReadError as error:
+        # The client closed the connection before sending the delimiter
+        source = memoryview(data + error.partial)
+
+    # Each read is bounded by the stream limit, not the whole source
+    if len(source) > MAX_SOURCE_BYTES:
+        raise asyncio.LimitOverrunError('Source exceeds MAX_SOURCE_BYTES', 0)
+    return source
+
+# handle_client_async
+async def handle_client_async(reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> None:
     """
     Handles a client's connection, receives Python code, runs Pylint,
     and sends back the result.
 
-    Receives data from the client until the specified delimiter ('<<EOF>>')
-    is encountered. Runs Pylint on the received code and sends the output
-    back to the client.
+    Receives the code from the client with read_source(). Runs Pylint on
+    the received code and sends the output back to the client. Sources
+    bigger than MAX_SOURCE_BYTES, or not received within CLIENT_TIMEOUT
+    seconds, are rejected with an error.
 
     Args:
-        client_socket (socket.socket): The socket object representing the
-            client connection.
-        addr (tuple): The address of the connected client.
+        reader (asyncio.StreamReader): Stream to read the client's data from.
+        writer (asyncio.StreamWriter): Stream to write the response to.
     """
+    addr = writer.get_extra_info('peername')
+    task = asyncio.current_task()
+    CLIENT_TASKS.add(task)
     try:
-        logging.info('Connection from %s' ,addr)
-
-        delimiter = '<<EOF>>'
-        buffer = ''
-
-        # Receive the file name and content from the client
-        while delimiter not in buffer:
-            data =  client_socket.recv(4096).decode('utf-8')
-            if not data:
-                break
-            buffer += data
-
-        # clean delimiter
-        file_content = buffer.replace(delimiter, '')
-        # run_pylint call
-        pylint_output = run_pylint(file_content)
+        logging.info('Connection from %s', addr)
+
+        # Receive the file content from the client
+        try:
+            source = await asyncio.wait_for(read_source(reader), CLIENT_TIMEOUT)
+        except asyncio.IncompleteReadError:
+            logging.warning('Connection from %s closed before sending the whole source', addr)
+            return
+        except asyncio.LimitOverrunError:
+            logging.warning('Source from %s exceeds %d bytes', addr, MAX_SOURCE_BYTES)
+            writer.write(b"ERR: source too large")
+            return
+        except TimeoutError:
+            logging.warning('Timed out waiting for the source from %s', addr)
+            writer.write(b"ERR: timed out waiting for the source")
+            return
+
+        # Invalid UTF-8 is kept as surrogates and left for Pylint to report
+        file_content = str(source, 'utf-8', 'surrogateescape')
         # Send a message to client
-        client_socket.sendall(b"Analyzing file... ")
-        logging.info('Running Pylint on file %s')
+        writer.write(b"Analyzing file... ")
+        await writer.drain()
+        logging.debug('Running Pylint (%d bytes)', len(file_content))
         # Run Pylint on the received file
-        pylint_output = run_pylint(file_content)
+        pylint_output = await run_pylint_async(file_content)
         # Send Pylint's output back to the client (plain text)
-        client_socket.sendall(pylint_output.encode())
-    except socket.error as error:
+        writer.write(pylint_output)
+        await writer.drain()
+    except PylintError as error:
+        # Already logged by the worker that ran Pylint
+        writer.write(error.message.encode('utf-8', 'surrogateescape'))
+    except asyncio.CancelledError:
+        # Cancelled by serve() when the clients outlast SHUTDOWN_TIMEOUT; the
+        # task ends normally, asyncio logs a traceback for cancelled handlers
+        logging.warning('Closing connection from %s, the server is shutting down', addr)
+        writer.write(b"ERR: server is shutting down")
+    except OSError as error:
+        # Usually the client went away, a traceback adds nothing
+        logging.error('Error handling connection : %s', error)
+        writer.write(f"Server error: {error}".encode())
+    except Exception as error:  # pylint: disable=broad-exception-caught
         logging.error('Error handling connection : %s', error, exc_info=True)
-        client_socket.sendall(f"Server error: {error}".encode())
+        writer.write(f"Server error: {error}".encode())
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        CLIENT_TASKS.discard(task)
+        logging.debug("Connection closed.")
+
+# serve
+async def serve(env_vars: StatusEnvironmentVariable) -> None:
+    """
+    Runs the asyncio server until SIGINT or SIGTERM is received.
+
+    On a signal the listening socket is closed, the connected clients get
+    up to SHUTDOWN_TIMEOUT seconds to receive their reports before their
+    connections are closed, and then the worker pool is shut down.
+
+    Args:
+        env_vars (StatusEnvironmentVariable): IP address and port to bind to.
+    """
+    global PYLINT_POOL  # pylint: disable=global-statement
+    PYLINT_POOL = create_pylint_pool()
+    # Start and warm up every worker before accepting clients; concurrent
+    # submissions make the pool spawn one worker for each of them
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(
+        loop.run_in_executor(PYLINT_POOL, os.getpid) for _ in range(MAX_CONCURRENT_JOBS)
+    ))
+
+    server = await asyncio.start_server(
+        handle_client_async, env_vars.IP_ADDRESS, env_vars.PORT,
+        backlog=1024, limit=MAX_SOURCE_BYTES + len(DELIMITER), start_serving=False
+    )
+
+    # Accepted sockets inherit the buffer sizes of the listening socket, which
+    # must be set before accepting so the TCP window scale is negotiated with them.
+    # asyncio already enables TCP_NODELAY on every accepted connection.
+    for server_socket in server.sockets:
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+
+    logging.info("Pylint server running at %s:%s...", env_vars.IP_ADDRESS, env_vars.PORT)
+
+    # The event loop wakes up from its selector when a signal arrives
+    stop_event = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    try:
+        async with server:
+            await server.start_serving()
+            await stop_event.wait()
+            # Stop accepting connections and let the connected clients finish
+            server.close()
+            if CLIENT_TASKS:
+                logging.info('Waiting for %d clients to finish', len(CLIENT_TASKS))
+                _, pending = await asyncio.wait(CLIENT_TASKS, timeout=SHUTDOWN_TIMEOUT)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending)
     finally:
-        client_socket.close()
-        logging.info("Connection closed.")
+        # Joining the workers blocks, keep the event loop running meanwhile
+        await loop.run_in_executor(
+            None, functools.partial(PYLINT_POOL.shutdown, cancel_futures=True)
+        )
 
 # start_server
 def start_server() -> None:
     """
     Starts the server and begins listening for incoming connections.
 
-    Reads the IP and port from the environment variables, sets up the server socket,
-    and begins listening for incoming connections. When a connection is received,
-    runs Pylint on the received file and sends the output back to the client.
+    Reads the IP and port from the environment variables and runs a single
+    event loop that multiplexes every client connection. Pylint itself runs
+    on a bounded pool of worker processes, so CPU-heavy analyses never block
+    the loop.
     """
-    # Ensure the values are being read from the environment variables in config.env
-    env_vars = check_vars_environment()
-
-    # Set up the server socket
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.bind((env_vars.IP_ADDRESS, env_vars.PORT))
-    server_socket.listen(5)
-
-    logging.info(f"Pylint server running at {env_vars.IP_ADDRESS}:{env_vars.PORT}...")
+    # Values read from the environment variables in config.env
+    env_vars = ENV
 
     try:
-        while True:
-            client_socket, addr = server_socket.accept()
-            threading.Thread(target=handle_client, args=(client_socket, addr)).start()
+        asyncio.run(serve(env_vars))
     except KeyboardInterrupt:
+        # Interrupted before serve() installed its signal handlers
         logging.info("Server stopped manually.")
-    finally:
-        server_socket.close()
+    else:
+        logging.info("Server stopped.")
 
 if __name__ == "__main__":
     start_server()
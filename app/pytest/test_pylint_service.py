@@ -1,14 +1,17 @@
 # pytest/test_pylint_service.py
 
 import os
+import asyncio
+import struct
 import pytest
-import socket
-import threading
+from concurrent.futures.process import BrokenProcessPool
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 # Ajustamos el import según la estructura de directorios
-from pylint_service.pylint_service import check_vars_environment, run_pylint, handle_client
+from pylint_service.pylint_service import (check_vars_environment, run_pylint, run_pylint_async,
+                                           read_source, handle_client_async, PylintResultCache,
+                                           PylintError)
 
 def test_check_vars_environment_valid(monkeypatch):
     # Configura variables de entorno válidas
@@ -49,31 +52,248 @@ def test_run_pylint_with_invalid_code():
     output = run_pylint(code)
     assert "syntax-error" in output or "expected an indented block" in output
 
+def test_run_pylint_does_not_carry_state_between_runs():
+    # El linter compartido no arrastra mensajes ni estadísticas del análisis anterior
+    run_pylint("import os\nprint(undefined)\n")
+    output = run_pylint('"""Module docstring."""\nVALUE = 1\n')
+    assert "undefined-variable" not in output
+    assert "Your code has been rated at 10.00/10" in output
+
 def test_run_pylint_with_empty_code():
     # Código vacío
     code = ""
     output = run_pylint(code)
     assert "Your code has been rated at" in output
 
-@patch('pylint_service.pylint_service.run_pylint')
-def test_handle_client(mock_run_pylint):
-    # Simula el comportamiento de run_pylint
-    mock_run_pylint.return_value = "Pylint analysis result"
-    
-    # Crea un socket de cliente simulado
-    client_socket = mock.MagicMock()
-    addr = ('127.0.0.1', 12345)
+def make_streams(*chunks, limit=2 ** 16):
+    # Crea un StreamReader con los datos del cliente y un writer simulado
+    reader = asyncio.StreamReader(limit=limit)
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    writer = mock.MagicMock()
+    writer.drain = mock.AsyncMock()
+    writer.wait_closed = mock.AsyncMock()
+    writer.get_extra_info.return_value = ('127.0.0.1', 12345)
+    return reader, writer
+
+@pytest.fixture
+def mock_run_pylint():
+    # Ejecuta run_pylint simulado en el executor por defecto, con una caché vacía
+    with patch('pylint_service.pylint_service.PYLINT_CACHE',
+               PylintResultCache(max_entries=8, ttl=60, max_bytes=1024)), \
+            patch('pylint_service.pylint_service.PYLINT_POOL', None), \
+            patch('pylint_service.pylint_service.run_pylint') as mock_run_pylint:
+        mock_run_pylint.return_value = "Pylint analysis result"
+        yield mock_run_pylint
 
+def test_handle_client(mock_run_pylint):
     # Simula los datos recibidos del cliente
     code = "def add(a, b):\n    return a + b\n"
     data = code + '<<EOF>>'
-    client_socket.recv.return_value = data.encode('utf-8')
 
-    # Ejecuta la función handle_client
-    handle_client(client_socket, addr)
+    async def scenario():
+        reader, writer = make_streams(data.encode('utf-8'))
+        # Ejecuta la función handle_client_async
+        await handle_client_async(reader, writer)
+        return writer
+
+    writer = asyncio.run(scenario())
 
-    # Verifica que sendall fue llamado con los datos correctos
-    calls = client_socket.sendall.call_args_list
+    # Verifica que write fue llamado con los datos correctos
+    calls = writer.write.call_args_list
     assert b"Analyzing file... " in calls[0][0][0]
     assert b"Pylint analysis result" in calls[1][0][0]
+    mock_run_pylint.assert_called_once_with(code)
+    writer.close.assert_called_once()
+
+def test_pylint_result_cache_evicts_least_recently_used():
+    cache = PylintResultCache(max_entries=2, ttl=60, max_bytes=1024)
+    cache.set('a', b'report a')
+    cache.set('b', b'report b')
+    # Usa 'a' para que 'b' sea el menos reciente
+    assert cache.get('a') == b'report a'
+    cache.set('c', b'report c')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'report a'
+    assert cache.get('c') == b'report c'
+
+def test_pylint_result_cache_expires_entries():
+    cache = PylintResultCache(max_entries=2, ttl=-1, max_bytes=1024)
+    cache.set('a', b'report a')
+    assert cache.get('a') is None
+
+def test_pylint_result_cache_evicts_by_size():
+    cache = PylintResultCache(max_entries=8, ttl=60, max_bytes=10)
+    cache.set('a', b'aaaa')
+    cache.set('b', b'bbbb')
+    # 'c' no cabe junto a 'a' y 'b': se descarta el menos reciente
+    cache.set('c', b'cccc')
+    assert cache.get('a') is None
+    assert cache.get('b') == b'bbbb'
+    assert cache.get('c') == b'cccc'
+    # Un reporte más grande que toda la caché no se guarda
+    cache.set('d', b'd' * 11)
+    assert cache.get('d') is None
+    assert cache.get('c') == b'cccc'
+
+def test_run_pylint_async_reuses_cached_report(mock_run_pylint):
+    code = "x = 1\n"
+
+    async def scenario():
+        return [await run_pylint_async(code), await run_pylint_async(code)]
+
+    # El segundo análisis del mismo código no ejecuta Pylint
+    assert asyncio.run(scenario()) == [b"Pylint analysis result"] * 2
+    mock_run_pylint.assert_called_once_with(code)
+
+def test_handle_client_without_delimiter(mock_run_pylint):
+    code = "x = 1\n"
+
+    async def scenario():
+        # El cliente cierra la conexión sin enviar '<<EOF>>'
+        reader, writer = make_streams(code.encode('utf-8'))
+        await handle_client_async(reader, writer)
+
+    asyncio.run(scenario())
+    mock_run_pylint.assert_called_with(code)
+
+def test_handle_client_multibyte_char_split_across_chunks(mock_run_pylint):
+    code = "NOMBRE = 'año'\n"
+    data = (code + '<<EOF>>').encode('utf-8')
+    # Corta los datos a mitad del carácter 'ñ' (dos bytes en UTF-8)
+    split = data.index('ñ'.encode('utf-8')) + 1
+
+    async def scenario():
+        reader, writer = make_streams(data[:split], data[split:])
+        await handle_client_async(reader, writer)
+
+    asyncio.run(scenario())
+    mock_run_pylint.assert_called_with(code)
+
+def test_handle_client_does_not_cache_pylint_errors(mock_run_pylint):
+    mock_run_pylint.side_effect = [PylintError("Error running Pylint: boom"),
+                                   "Pylint analysis result"]
+
+    async def scenario():
+        writers = []
+        for _ in range(2):
+            reader, writer = make_streams(b'x = 1\n<<EOF>>')
+            await handle_client_async(reader, writer)
+            writers.append(writer)
+        return writers
+
+    first, second = asyncio.run(scenario())
+    # El error llega al cliente pero no se guarda en la caché
+    assert first.write.call_args_list[1][0][0] == b"Error running Pylint: boom"
+    assert second.write.call_args_list[1][0][0] == b"Pylint analysis result"
+    assert mock_run_pylint.call_count == 2
+
+@patch('pylint_service.pylint_service.create_pylint_pool')
+def test_handle_client_restarts_broken_pool(mock_create_pylint_pool, mock_run_pylint):
+    # Un worker del pool murió mientras analizaba el código
+    mock_run_pylint.side_effect = BrokenProcessPool('A process in the pool was terminated')
+
+    async def scenario():
+        reader, writer = make_streams(b'x = 1\n<<EOF>>')
+        await handle_client_async(reader, writer)
+        return writer
+
+    writer = asyncio.run(scenario())
+    # El cliente recibe el error y el pool se reemplaza para los siguientes
+    assert writer.write.call_args_list[1][0][0].startswith(b"Server error: ")
+    mock_create_pylint_pool.assert_called_once_with()
+    writer.close.assert_called_once()
+
+def test_handle_client_closes_connection_when_cancelled(mock_run_pylint):
+    async def scenario():
+        # El cliente sigue conectado sin enviar nada cuando el servidor se detiene
+        reader = asyncio.StreamReader()
+        _, writer = make_streams()
+        task = asyncio.create_task(handle_client_async(reader, writer))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+        return task, writer
+
+    task, writer = asyncio.run(scenario())
+    # La tarea termina normalmente y el cliente recibe el aviso
+    assert not task.cancelled()
+    writer.write.assert_called_once_with(b"ERR: server is shutting down")
+    writer.close.assert_called_once()
+    mock_run_pylint.assert_not_called()
+
+def test_check_vars_environment_zero_port(monkeypatch):
+    # El puerto 0 pasa isdecimal pero no es válido
+    monkeypatch.setenv('IP_ADDRESS', '127.0.0.1')
+    monkeypatch.setenv('PORT', '0')
+    result = check_vars_environment()
+    assert result.status == False
+    assert result.PORT == 5000
+
+def test_handle_client_rejects_large_source(mock_run_pylint):
+    async def scenario():
+        # El código supera el límite del StreamReader
+        reader, writer = make_streams(b'x' * 2048 + b'<<EOF>>', limit=1024)
+        await handle_client_async(reader, writer)
+        return writer
+
+    writer = asyncio.run(scenario())
+    writer.write.assert_called_once_with(b"ERR: source too large")
+    writer.close.assert_called_once()
+    mock_run_pylint.assert_not_called()
+
+def test_handle_client_invalid_utf8(mock_run_pylint):
+    data = b'X = "\xff"\n'
+
+    async def scenario():
+        # Los bytes que no son UTF-8 válido no cortan la conexión
+        reader, writer = make_streams(data + b'<<EOF>>')
+        await handle_client_async(reader, writer)
+        return writer
+
+    writer = asyncio.run(scenario())
+    mock_run_pylint.assert_called_once_with(data.decode('utf-8', 'surrogateescape'))
+    assert b"Pylint analysis result" in writer.write.call_args_list[1][0][0]
+
+def read_source_from(*chunks, limit=2 ** 16):
+    # Ejecuta read_source sobre los datos dados y devuelve los bytes leídos
+    async def scenario():
+        reader, _ = make_streams(*chunks, limit=limit)
+        return bytes(await read_source(reader))
+    return asyncio.run(scenario())
+
+def test_read_source_with_size_header():
+    code = b"x = '<<EOF>>'\n"
+    assert read_source_from(struct.pack('>I', len(code)), code) == code
+
+def test_read_source_with_delimiter():
+    code = b"def add(a, b):\n    return a + b\n"
+    assert read_source_from(code + b'<<EOF>>') == code
+    # Código vacío enviado solo con el delimitador
+    assert read_source_from(b'<<EOF>>') == b''
+
+def test_read_source_with_delimiter_after_angle_bracket():
+    # El delimitador empieza después de un '<' del código
+    assert read_source_from(b'<<<EOF>>') == b'<'
+    assert read_source_from(b'<', b'<<EOF>>') == b'<'
+    # '<EOF>>' sin el '<' inicial forma parte del código
+    assert read_source_from(b'x<EOF>>y<<EOF>>') == b'x<EOF>>y'
+    assert read_source_from(b'<EOF>><<EOF>>') == b'<EOF>>'
+
+def test_read_source_rejects_large_size_header():
+    with pytest.raises(asyncio.LimitOverrunError):
+        read_source_from(struct.pack('>I', (1 << 20) + 1))
+
+def test_read_source_rejects_large_delimited_source():
+    # Cada lectura cabe en el límite del StreamReader, pero el código completo no
+    max_source_bytes = 1 << 20
+    data = (b'a' * (max_source_bytes - 100) + b'<EOF>>'
+            + b'b' * (max_source_bytes - 100) + b'<<EOF>>')
+    with pytest.raises(asyncio.LimitOverrunError):
+        read_source_from(data, limit=max_source_bytes + len(b'<<EOF>>'))
 
+def test_read_source_incomplete_size_header_source():
+    # El cliente cierra la conexión antes de enviar el tamaño anunciado
+    with pytest.raises(asyncio.IncompleteReadError):
+        read_source_from(struct.pack('>I', 100), b'x = 1\n')